@@ -211,7 +211,7 @@ class RequestManager:
         
     ) -> None:
         """Track metrics for successful responses."""
-        self.test_logger.response_times.append({
+        self.test_logger.record_response_time({
             'endpoint': url.replace(self.base_url, '').strip('/'),
             'method': method,
             'duration': duration,
@@ -229,7 +229,7 @@ class RequestManager:
         attempt: int
     ) -> None:
         """Track metrics for failed requests."""
-        self.test_logger.response_times.append({
+        self.test_logger.record_response_time({
             'endpoint': url.replace(self.base_url, '').strip('/'),
             'method': method,
             'duration': duration,
@@ -1,7 +1,7 @@
 from .baseAPI import BaseAPITest
 from .CustomTestResult import CustomTestResult
 from .CustomTestRunner import CustomTestRunner
-from .report import DocxReportGenerator, HTMLReportGenerator, LogManager
+from .report import DocxReportGenerator, HTMLReportGenerator, LogManager, RunningStats
 from .auth import Authenticator 
 from .RequestManager import RequestManager 
 __all__ = [
@@ -11,6 +11,7 @@ __all__ = [
     'DocxReportGenerator',
     'HTMLReportGenerator',
     'LogManager',
+    'RunningStats',
     'Authenticator',
     'RequestManager'
 ]
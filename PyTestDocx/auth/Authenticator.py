@@ -76,13 +76,21 @@ class Authenticator:
     def get_auth_headers(test_instance) -> Dict[str, str]:
         """Get headers with current access token for authenticated requests
         
+        The dictionary is built once per access token and returned as-is on later
+        calls until the token changes (e.g. after a new login), so callers should
+        not modify it in place.
+        
         Args:
             test_instance (BaseAPITest): Instance of the test class requiring authentication headers
             
         Returns:
             Dict[str, str]: Dictionary containing Authorization and Content-Type headers
         """
-        return {
-            'Authorization': f'Bearer {test_instance.access_token}',
-            'Content-Type': 'application/json'
-        }
\ No newline at end of file
+        token = test_instance.access_token
+        cached = getattr(test_instance, '_auth_headers', None)
+        if cached is None or cached[0] != token:
+            cached = test_instance._auth_headers = (token, {
+                'Authorization': f'Bearer {token}',
+                'Content-Type': 'application/json'
+            })
+        return cached[1]
@@ -43,6 +43,7 @@ class BaseAPITest(unittest.TestCase):
         cls.headers = {'Content-Type': 'application/json'}  # Default headers
         cls.access_token = None  # Will store authentication token
         cls.user_id = None       # Will store authenticated user ID
+        cls._auth_headers = None  # (access_token, headers) cached by auth_headers()
         cls.request_handler = RequestManager(cls.base_url, cls.session, cls.test_logger)
     @classmethod
     def tearDownClass(cls):
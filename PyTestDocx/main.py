@@ -34,6 +34,8 @@ class TestRunner:
         parser = argparse.ArgumentParser(description='Run API tests')
         parser.add_argument('--test-dir', default='tests',
                           help='Directory containing test files (default: tests)')
+        parser.add_argument('--no-charts', action='store_true',
+                          help='Leave charts out of the Word report')
         self.args = parser.parse_args() # Parse command-line arguments
 
     def validate_test_directory(self):
@@ -131,7 +133,8 @@ class TestRunner:
             start_time=self.start_time,
             end_time=self.end_time,
             base_url=BaseAPITest.base_url,
-            env_info=self.env_info
+            env_info=self.env_info,
+            charts_enabled=not self.args.no_charts
         )
         report.generate()
         report.save('test_report.docx')
@@ -141,6 +144,7 @@ class TestRunner:
         'test_errors': BaseAPITest.test_logger.test_errors,
         'false_positives': self.false_positives,
         'response_times': BaseAPITest.test_logger.response_times,
+        'response_stats': BaseAPITest.test_logger.response_stats,
         'test_result': self.result,
         'test_statuses': self.test_statuses,
         'start_time': self.start_time,
@@ -1,22 +1,279 @@
 from docx import Document
-from docx.shared import RGBColor, Pt, Inches
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.shared import RGBColor, Pt, Inches, Emu
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
 from docx.enum.table import WD_ROW_HEIGHT, WD_TABLE_ALIGNMENT
-import matplotlib.pyplot as plt
+from xml.sax.saxutils import escape
+from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import logging
-import time
+from datetime import datetime
 import os
+import io
+import re
+import math
 from collections import defaultdict
+from functools import lru_cache
+from copy import deepcopy
+from contextlib import contextmanager
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Shared color palette, allocated once instead of per cell/run
+_CLR_GREEN = RGBColor(0x00, 0x80, 0x00)      # Pure green (success color)
+_CLR_RED = RGBColor(0xFF, 0x00, 0x00)        # Bright red
+_CLR_DARK_RED = RGBColor(0x99, 0x00, 0x00)   # Darker red (no failures)
+_CLR_ORANGE = RGBColor(0xFF, 0xA5, 0x00)     # Orange (warnings)
+_CLR_DARKBLUE = RGBColor(0x00, 0x00, 0x8B)   # Dark blue
+_CLR_BLUE = RGBColor(0x00, 0x00, 0xFF)       # Blue
+_CLR_MAROON = RGBColor(0x8B, 0x00, 0x00)     # Dark red (error messages)
+_CLR_PURPLE = RGBColor(0x80, 0x00, 0x80)     # Purple
+_CLR_TEAL = RGBColor(0x00, 0x80, 0x80)       # Teal
+_CLR_BROWN = RGBColor(0xA5, 0x2A, 0x2A)      # Brown (JSON content)
+_CLR_TITLE = RGBColor(0x2C, 0x3E, 0x50)      # Dark slate blue (cover title)
+_CLR_BLACK = RGBColor(0x00, 0x00, 0x00)      # Black (stats table text)
+
+# Summary table header colors
+_CLR_HDR_PASSED = RGBColor(0x4C, 0xAF, 0x50)     # Green
+_CLR_HDR_FAILED = RGBColor(0xFF, 0x52, 0x52)     # Red
+_CLR_HDR_PASS_RATE = RGBColor(0x21, 0x96, 0xF3)  # Blue
+
+# Error report line styles keyed by the label before the first ':'
+# (bold, italic, underline, color, font size, bordered paragraph)
+_LINE_STYLES = {
+    "Test Description": (True, False, False, _CLR_DARKBLUE, Pt(12), False),
+    "Test": (True, False, False, _CLR_BLUE, None, False),
+    "Error Type": (True, False, False, _CLR_RED, None, False),
+    "Error Message": (False, True, False, _CLR_MAROON, None, True),
+    "Request Body": (True, False, False, _CLR_PURPLE, None, False),
+    "Response Status": (False, False, False, _CLR_GREEN, None, False),
+    "Response URL": (False, False, False, _CLR_GREEN, None, False),
+    "Response Content": (False, False, True, _CLR_TEAL, None, False),
+}
+_ERROR_SEPARATOR = "-" * 40
+
+# Timestamp formats for the cover page and the execution information table
+_COVER_DATE_FMT = '%B %d, %Y %H:%M:%S'
+_TIMESTAMP_FMT = '%Y-%m-%d %H:%M:%S'
+
+# Document styles looked up once per document (see DocxReportGenerator._cache_styles)
+_STYLE_NAMES = (
+    'Normal', 'Heading 1', 'Heading 2', 'Heading 3', 'Intense Quote',
+    'Table Grid', 'Light Grid Accent 1', 'Light List Accent 1',
+)
+
+
+def _rpr_xml(bold=False, italic=False, underline=False, color=None, size=None):
+    """Return the child elements of a <w:rPr> as an XML string, in schema order"""
+    return ''.join((
+        '<w:b/>' if bold else '',
+        '<w:i/>' if italic else '',
+        f'<w:color w:val="{color}"/>' if color is not None else '',
+        f'<w:sz w:val="{int(size.pt * 2)}"/>' if size is not None else '',  # Half-points
+        '<w:u w:val="single"/>' if underline else '',
+    ))
+
+
+def _build_rpr(bold=False, italic=False, underline=False, color=None, size=None):
+    """Build a <w:rPr> element once so error runs can clone it instead of styling each run"""
+    return parse_xml(f'<w:rPr {nsdecls("w")}>{_rpr_xml(bold, italic, underline, color, size)}</w:rPr>')
+
+
+def _cell_xml(value, rpr, width):
+    """Return a <w:tc> holding a single run with the given text and run properties"""
+    text = str(value)
+    run = f'<w:rPr>{rpr}</w:rPr>' if rpr else ''
+    if text:
+        space = ' xml:space="preserve"' if text != text.strip() else ''
+        run += f'<w:t{space}>{escape(text)}</w:t>'
+    return (
+        f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr>'
+        f'<w:p><w:r>{run}</w:r></w:p></w:tc>'
+    )
+
+
+# Prebuilt run properties for each styled error line prefix, plus JSON content
+_LINE_RPR = {key: _build_rpr(*style[:5]) for key, style in _LINE_STYLES.items()}
+_JSON_RPR = _build_rpr(color=_CLR_BROWN)
+_BOLD_RPR_XML = _rpr_xml(bold=True)  # Bold table labels
+
+# Single dark red border on all four sides of an error message paragraph
+_BORDER_TMPL = parse_xml(
+    f'<w:pBorders {nsdecls("w")}>'
+    + ''.join(
+        f'<w:{side} w:val="single" w:sz="12" w:space="0" w:color="8B0000"/>'
+        for side in ('top', 'left', 'bottom', 'right')
+    )
+    + '</w:pBorders>'
+)
+
+# Footer run holding a PAGE field (begin marker, instruction, end marker)
+_PAGE_FIELD_RUN = parse_xml(
+    f'<w:r {nsdecls("w")}><w:fldChar w:fldCharType="begin"/>'
+    '<w:instrText xml:space="preserve">PAGE</w:instrText>'
+    '<w:fldChar w:fldCharType="end"/></w:r>'
+)
+
+# Failure classification: one regex pass per error, labels listed in priority order.
+# The lookahead also reports overlapping tokens (e.g. "40401" holds both 404 and 401).
+_ERR_RE = re.compile(r"(?=(400|401|404|500|Timeout))")
+_ERR_MAP = {
+    "400": "Bad Request (400)",
+    "401": "Unauthorized (401)",
+    "404": "Not Found (404)",
+    "500": "Server Error (500)",
+    "Timeout": "Timeout",
+}
+
+
+def _classify_error(error):
+    """Return the failure category label for a single error message"""
+    found = set(_ERR_RE.findall(error if isinstance(error, str) else str(error)))
+    if found:
+        for token, label in _ERR_MAP.items():
+            if token in found:
+                return label
+    return "Other Errors"
+
+
+def _new_figure(figsize=None):
+    """Create a Figure bound to the non-interactive Agg canvas, independent of the pyplot backend"""
+    # Imported on first use so runs without charts never load matplotlib
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+# Chart figures kept alive between renders, one per figure size, each guarded by its own lock
+_FIGURES = {}
+_FIGURES_LOCK = threading.Lock()
+
+
+@contextmanager
+def _reused_figure(figsize=None):
+    """
+    Yield a cleared Figure of the given size, reusing it across renders.
+
+    Avoids re-creating the Figure and canvas for every chart. Charts of
+    different sizes render concurrently; charts sharing a size take turns.
+    """
+    with _FIGURES_LOCK:
+        entry = _FIGURES.get(figsize)
+        if entry is None:
+            entry = _FIGURES[figsize] = (_new_figure(figsize), threading.Lock())
+    fig, lock = entry
+    with lock:
+        fig.clear()
+        yield fig
+
+
+def _figure_to_png(fig, **savefig_kwargs):
+    """Render a matplotlib Figure to PNG bytes in memory"""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', **savefig_kwargs)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=32)
+def _render_donut(labels, sizes, colors, figsize, title, dpi=None, compress_level=None):
+    """
+    Render a titled donut chart to PNG bytes.
+
+    Memoized on the chart inputs, so identical error histograms across
+    generate() calls skip matplotlib entirely.
+    All arguments must be hashable (tuples instead of lists).
+    """
+    savefig_kwargs = {}
+    if dpi:
+        savefig_kwargs['dpi'] = dpi
+    if compress_level is not None:
+        savefig_kwargs['pil_kwargs'] = {'compress_level': compress_level}  # zlib level for the PNG encoder
+
+    with _reused_figure(figsize) as fig:
+        ax = fig.subplots()
+        # Use a donut chart for better readability
+        ax.pie(
+            sizes,
+            labels=labels,
+            colors=colors,
+            autopct='%1.1f%%',
+            startangle=90,
+            wedgeprops={'width': 0.4},  # Makes it a donut
+            textprops={'fontsize': 8}
+        )
+        ax.axis('equal')  # Equal aspect ratio ensures circular pie
+        ax.set_title(title, pad=20)
+        return _figure_to_png(fig, **savefig_kwargs)
+
+
+# Summary pie geometry (pixels): canvas, pie center and radius, label font size
+_PIE_CANVAS = (480, 400)
+_PIE_CENTER = (240, 200)
+_PIE_RADIUS = 150
+_PIE_FONT_SIZE = 16
+_PIE_SUPERSAMPLE = 4  # Wedges are drawn larger and downscaled, since pieslice is not antialiased
+
+
+@lru_cache(maxsize=1)
+def _pie_font():
+    """Pillow's bundled font, loaded once"""
+    return ImageFont.load_default(size=_PIE_FONT_SIZE)
+
+
+@lru_cache(maxsize=32)
+def _render_simple_pie(labels, sizes, colors):
+    """
+    Render a flat pie chart with Pillow and return it as PNG bytes.
+
+    Laid out like the matplotlib pie (first wedge starting at 12 o'clock and
+    running counter-clockwise, labels outside, percentages inside) without
+    loading matplotlib. Memoized on its (hashable) arguments.
+    """
+    scale = _PIE_SUPERSAMPLE
+    cx, cy = _PIE_CENTER
+    img = Image.new('RGB', (_PIE_CANVAS[0] * scale, _PIE_CANVAS[1] * scale), 'white')
+    draw = ImageDraw.Draw(img)
+    box = [(cx - _PIE_RADIUS) * scale, (cy - _PIE_RADIUS) * scale,
+           (cx + _PIE_RADIUS) * scale, (cy + _PIE_RADIUS) * scale]
+
+    # Pillow angles run clockwise from 3 o'clock, so walk backwards from 270 (12 o'clock)
+    total = sum(sizes)
+    end = 270.0
+    wedges = []
+    for label, size, color in zip(labels, sizes, colors):
+        sweep = 360.0 * size / total
+        if sweep:
+            draw.pieslice(box, end - sweep, end, fill=color)
+        wedges.append((label, size, end - sweep / 2))
+        end -= sweep
+    img = img.resize(_PIE_CANVAS, Image.LANCZOS)
+
+    # Text is drawn at final size so the font stays crisp
+    draw = ImageDraw.Draw(img)
+    font = _pie_font()
+    for label, size, mid in wedges:
+        dx, dy = math.cos(math.radians(mid)), math.sin(math.radians(mid))
+        draw.text((cx + dx * _PIE_RADIUS * 0.6, cy + dy * _PIE_RADIUS * 0.6),
+                  f"{100.0 * size / total:.1f}%", fill='black', font=font, anchor='mm')
+        draw.text((cx + dx * _PIE_RADIUS * 1.1, cy + dy * _PIE_RADIUS * 1.1),
+                  label, fill='black', font=font, anchor='lm' if dx >= 0 else 'rm')
+
+    buf = io.BytesIO()
+    img.save(buf, format='PNG')
+    return buf.getvalue()
+
+
 class DocxReportGenerator:
     """Generates comprehensive Word document reports for API test results"""
-    
+
     def __init__(self, test_errors, false_positives, response_times, test_result, 
-                 test_statuses, start_time, end_time, base_url, env_info):
+                 test_statuses, start_time, end_time, base_url, env_info, charts_enabled=True):
         """
         Initialize report generator with test data
         
@@ -30,6 +287,7 @@ class DocxReportGenerator:
             end_time (float): Test execution end timestamp
             base_url (str): Base API URL tested
             env_info (dict): Environment information
+            charts_enabled (bool): Include charts in the report (default: True)
         """
         self.test_errors = test_errors
         self.false_positives = false_positives
@@ -40,25 +298,78 @@ class DocxReportGenerator:
         self.end_time = end_time
         self.base_url = base_url
         self.env_info = env_info
+        self.charts_enabled = charts_enabled
         self.doc = None  # Will hold the Word document object
-
-        # Calculate test metrics
-        self.total_tests = test_result.testsRun if test_result else 0
-        self.passed = self.total_tests - len(test_result.failures) - len(test_result.errors) if test_result else 0
-        self.failed = len(test_result.failures) + len(test_result.errors) if test_result else len(test_errors)
+        self._styles = {}  # Style objects of self.doc, filled by _cache_styles
+
+        # Calculate test metrics once; every section reads these attributes
+        if test_result:
+            fails = len(test_result.failures)
+            errs = len(test_result.errors)
+            self.total_tests = test_result.testsRun
+            self.failed = fails + errs
+            self.passed = self.total_tests - self.failed
+        else:
+            self.total_tests = 0
+            self.failed = len(test_errors)
+            self.passed = 0
+        self.pass_rate = (self.passed / self.total_tests) * 100 if self.total_tests > 0 else 0.0
+        self.fp_count = len(false_positives)
+
+        # Response data materialized once as parallel arrays (endpoint, duration) for the stats and chart sections
+        self._endpoints, self._durations = self._collect_response_arrays()
 
     def generate(self):
         """Generate the complete report document with all sections"""
         self._create_base_document()  # Initialize document structure
-        self._add_summary_table()     # Add test summary table
-        self._add_summary_chart()     # Add pie chart visualization
-        self._analyze_failures() # Add tests passed and failed charts diving the errors
-        self._add_response_time_chart()  # Add response time analysis
+        error_types = self._classify_failures()
+
+        # Charts render to PNG in the background while this thread builds the text sections;
+        # each picture is inserted once its section is reached
+        with ThreadPoolExecutor() as executor:
+            charts = self.charts_enabled
+            summary_chart = executor.submit(self._render_summary_chart) if charts else None
+            failure_chart = executor.submit(self._render_failure_chart, error_types) if charts and error_types else None
+            response_chart = executor.submit(self._render_response_time_chart) if charts else None
+
+            self._add_summary_table()     # Add test summary table
+            if summary_chart:
+                self._add_summary_chart(summary_chart)     # Add pie chart visualization
+            self._analyze_failures(error_types, failure_chart) # Add tests passed and failed charts diving the errors
+            if response_chart:
+                self._add_response_time_chart(response_chart)  # Add response time analysis
         self._add_response_time_stats() # avarage time, max and min time
         self._add_test_case_list()      # List Of All the Tests wish passes and fails
-        self._add_environment_info()  # Add environment details
-        self._add_execution_info()    # Add timing information
-        self._add_error_section()     # Add detailed error reports
+        self._add_environment_info()    # Add environment details
+        self._add_execution_info()      # Add timing information
+        self._add_error_section()       # Add detailed error reports
+        self._set_error_font()
+
+    def _add_xml_table(self, rows, style):
+        """
+        Append a fully populated table built from a single XML string.
+
+        rows holds one list of (value, rpr) cells per table row, where rpr is the
+        inner XML of the cell's run properties ('' for default formatting).
+        Produces the same markup as add_table plus per-cell text and run styling.
+        """
+        # Even column widths across the text area, as add_table does
+        section = self.doc.sections[-1]
+        text_width = section.page_width - section.left_margin - section.right_margin
+        width = Emu(text_width // len(rows[0])).twips
+        grid = f'<w:gridCol w:w="{width}"/>' * len(rows[0])
+        trs = ''.join(
+            '<w:tr>' + ''.join(_cell_xml(value, rpr, width) for value, rpr in row) + '</w:tr>'
+            for row in rows
+        )
+        tbl = parse_xml(
+            f'<w:tbl {nsdecls("w")}><w:tblPr><w:tblStyle w:val="{style.style_id}"/>'
+            '<w:tblW w:type="auto" w:w="0"/>'
+            '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+            'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+            f'<w:tblGrid>{grid}</w:tblGrid>{trs}</w:tbl>'
+        )
+        self.doc.element.body.insert_element_before(tbl, 'w:sectPr')  # Keep <w:sectPr> last
 
     def save(self, filename):
         """Save the generated document to file"""
@@ -67,9 +378,15 @@ class DocxReportGenerator:
     def _create_base_document(self):
         """Create the basic document structure with header and footer"""
         self.doc = Document()
+        self._cache_styles()
         self._add_header()  # Add report title
         self._add_footer()  # Add page numbering
 
+    def _cache_styles(self):
+        """Look up the styles used by the report once per document instead of at every call site"""
+        styles = self.doc.styles
+        self._styles = {name: styles[name] for name in _STYLE_NAMES}
+
 
     def _add_header(self):
         """Add styled document header with title and timestamp"""
@@ -81,7 +398,7 @@ class DocxReportGenerator:
         title = self.doc.add_paragraph()
         title_run = title.add_run("AUTOMATED TEST REPORT\n")
         title_run.font.size = Pt(28)
-        title_run.font.color.rgb = RGBColor(0x2C, 0x3E, 0x50)  # Dark blue
+        title_run.font.color.rgb = _CLR_TITLE
         title_run.bold = True
         title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
@@ -99,8 +416,9 @@ class DocxReportGenerator:
 
         # Add logo
         try:
-            self.doc.add_picture('logo.png', width=Inches(2))
-            self.doc.paragraphs[-1].alignment = WD_ALIGN_PARAGRAPH.CENTER
+            logo = self.doc.add_paragraph()
+            logo.add_run().add_picture('logo.png', width=Inches(2))
+            logo.alignment = WD_ALIGN_PARAGRAPH.CENTER
         except FileNotFoundError:
             logger.warning("Company logo not found, skipping cover page image")
 
@@ -116,7 +434,7 @@ class DocxReportGenerator:
 
 
         # Report Date
-        date_str = time.strftime('%B %d, %Y %H:%M:%S', time.localtime() )
+        date_str = datetime.now().strftime(_COVER_DATE_FMT)
         date_para = self.doc.add_paragraph()
         date_run = date_para.add_run(f"Generated on: {date_str}")
         date_run.italic = True
@@ -132,200 +450,137 @@ class DocxReportGenerator:
         paragraph = footer.paragraphs[0]
         paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT  # Right-align footer
         
-        # Create page number field using Word XML
-        run = paragraph.add_run()
-        fldChar = OxmlElement('w:fldChar')
-        fldChar.set(qn('w:fldCharType'), 'begin')
-        run._r.append(fldChar)
-        
-        instrText = OxmlElement('w:instrText')
-        instrText.set(qn('xml:space'), 'preserve')
-        instrText.text = 'PAGE'
-        run._r.append(instrText)
-        
-        fldChar = OxmlElement('w:fldChar')
-        fldChar.set(qn('w:fldCharType'), 'end')
-        run._r.append(fldChar)
+        # Create page number field using Word XML, cloned from a prebuilt run
+        paragraph._p.append(deepcopy(_PAGE_FIELD_RUN))
 
     def _add_summary_table(self):
         """Add table showing test pass/fail summary"""
-        table = self.doc.add_table(rows=2, cols=5)
-        table.style = 'Light Grid Accent 1'
-        
         # Header row with styling
-        hdr_cells = table.rows[0].cells
         headers = [
-            ('Total Tests', ''),
-            ('Passed', '4CAF50'),  # Green
-            ('Failed', 'FF5252'),   # Red
-            ('Pass Rate', '2196F3'), # Blue
-            ('False Positives', 'FFA500') # Orange
+            ('Total Tests', None),
+            ('Passed', _CLR_HDR_PASSED),
+            ('Failed', _CLR_HDR_FAILED),
+            ('Pass Rate', _CLR_HDR_PASS_RATE),
+            ('False Positives', _CLR_ORANGE)
         ]
-        
-        for i, (text, color) in enumerate(headers):
-            hdr_cells[i].text = text
-            if color:
-                hdr_cells[i].paragraphs[0].runs[0].font.color.rgb = RGBColor.from_string(color)
-            hdr_cells[i].paragraphs[0].runs[0].bold = True
-        
+        header_row = [(text, _rpr_xml(bold=True, color=color)) for text, color in headers]
+
         # Data row with conditional formatting
-        row_cells = table.rows[1].cells
-        
-        # Total Tests
-        row_cells[0].text = str(self.total_tests)
-        
-        # Passed (green)
-        passed_cell = row_cells[1]
-        passed_cell.text = str(self.passed)
-        passed_cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(0x00, 0x80, 0x00) # Pure Green (success color)
-        
-        # Failed (red with conditional intensity)
-        failed_cell = row_cells[2]
-        failed_cell.text = str(self.failed)
-        fail_color = RGBColor(0xFF, 0x00, 0x00) if self.failed > 0 else RGBColor(0x99, 0x00, 0x00) #  Bright Red (when failures > 0)  Darker Red (when no failures)
-        failed_cell.paragraphs[0].runs[0].font.color.rgb = fail_color
-        
-        # Pass Rate (percentage with icon)
-        pass_rate = (self.passed / self.total_tests) * 100 if self.total_tests > 0 else 0
-        pass_rate_cell = row_cells[3]
-        pass_rate_cell.text = f"{pass_rate:.1f}%"
-        
+        fail_color = _CLR_RED if self.failed > 0 else _CLR_DARK_RED #  Bright Red (when failures > 0)  Darker Red (when no failures)
+
         # Color based on pass rate threshold
-        if pass_rate >= 90:
-            pass_rate_cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(0x00, 0x80, 0x00) # Green (excellent performance)
-        elif pass_rate >= 70:
-            pass_rate_cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(0xFF, 0xA5, 0x00) # Orange (warning/needs review)
-            pass_rate_cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(0xFF, 0x00, 0x00) # Red (critical condition)
-        
-        # False Positives
-        fp_count = len(self.false_positives)
-        fp_cell = row_cells[4]
-        fp_cell.text = str(fp_count)
-        if fp_count > 0:
-            fp_cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(0xFF, 0xA5, 0x00)  # Orange
+        if self.pass_rate >= 90:
+            rate_color = _CLR_GREEN # Green (excellent performance)
+        elif self.pass_rate >= 70:
+            rate_color = _CLR_ORANGE # Orange (warning/needs review)
+        else:
+            rate_color = _CLR_RED # Red (critical condition)
+
+        fp_count = self.fp_count
+        data_row = [
+            (self.total_tests, ''),                          # Total Tests
+            (self.passed, _rpr_xml(color=_CLR_GREEN)),       # Passed (green)
+            (self.failed, _rpr_xml(color=fail_color)),       # Failed (red with conditional intensity)
+            (f"{self.pass_rate:.1f}%", _rpr_xml(color=rate_color)),  # Pass Rate (percentage)
+            (fp_count, _rpr_xml(color=_CLR_ORANGE) if fp_count > 0 else ''),  # False Positives
+        ]
+        self._add_xml_table([header_row, data_row], self._styles['Light Grid Accent 1'])
         
         # Add contextual note
         if fp_count > 0:
             note = self.doc.add_paragraph()
             note.add_run("Note: ").bold = True
             note.add_run(f"{fp_count} test(s) returned 200 status but failed assertions")
-            note.runs[0].font.color.rgb = RGBColor(0xFF, 0xA5, 0x00)
-            note.style = 'Intense Quote'
+            note.runs[0].font.color.rgb = _CLR_ORANGE
+            note.style = self._styles['Intense Quote']
         
         # Add visual separator
         self.doc.add_paragraph().add_run().add_break()
 
-    def _add_summary_chart(self):
-        """Generate and insert pie chart showing test results"""
+    def _render_summary_chart(self):
+        """Render pie chart showing test results and return it as PNG bytes"""
+        if self.total_tests == 0:
+            return None  # Nothing to chart
+        # Two flat wedges do not need matplotlib; Pillow draws them directly
+        return _render_simple_pie(
+            ('Passed', 'Failed'),
+            (self.passed, self.failed),
+            ('#4CAF50', '#FF5252')  # Green and red
+        )
+
+    def _add_summary_chart(self, chart):
+        """Insert pie chart showing test results"""
         try:
-            # Chart data
-            labels = ['Passed', 'Failed']
-            sizes = [self.passed, self.failed]
-            colors = ['#4CAF50', '#FF5252']  # Green and red
-            
-            # Create pie chart
-            fig, ax = plt.subplots()
-            ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-            ax.axis('equal')  # Equal aspect ratio ensures circular pie
-            
-            # Save chart to temporary file
-            chart_path = "test_summary_chart.png"
-            plt.savefig(chart_path, bbox_inches='tight')
-            plt.close(fig)
+            png = chart.result()
+            if png is None:
+                return  # Skip if no tests ran
             
             # Insert chart into document
-            self.doc.add_paragraph("Test Results Overview:")
-            self.doc.paragraphs[-1].style = self.doc.styles['Heading 2']
-            self.doc.add_picture(chart_path, width=Pt(300))  # 300 points wide
-            os.remove(chart_path)  # Clean up temporary file
+            self.doc.add_paragraph("Test Results Overview:", style=self._styles['Heading 2'])
+            self.doc.add_picture(io.BytesIO(png), width=Pt(300))  # 300 points wide
         except Exception as e:
             logger.error(f"Failed to generate chart: {str(e)}")
 
-    def _analyze_failures(self):
-        """Categorize failures and generate a visualization chart"""
+    def _classify_failures(self):
+        """Categorize failures by error type"""
         error_types = defaultdict(int)
         
         # Classify errors
         for error in self.test_errors:
-            if "400" in str(error):
-                error_types["Bad Request (400)"] += 1
-            elif "401" in str(error):
-                error_types["Unauthorized (401)"] += 1
-            elif "404" in str(error):
-                error_types["Not Found (404)"] += 1
-            elif "500" in str(error):
-                error_types["Server Error (500)"] += 1
-            elif "Timeout" in str(error):
-                error_types["Timeout"] += 1
-            else:
-                error_types["Other Errors"] += 1
+            error_types[_classify_error(error)] += 1
         
         # Add false positives if they exist
-        if hasattr(self, 'false_positives') and self.false_positives:
-            error_types["False Positives (200)"] = len(self.false_positives)
-        
-        
+        if self.fp_count:
+            error_types["False Positives (200)"] = self.fp_count
+        return error_types
+
+    def _analyze_failures(self, error_types, chart):
+        """Add the failure statistics table and the failure distribution chart"""
         # Always show the table (even if empty)
         self._display_failure_table(error_types)
 
-        # Generate the chart only if there are failures
-        if error_types:
-            self._generate_failure_chart(error_types)
-
-    def _generate_failure_chart(self, error_types):
-        """Generate a pie/donut chart of failure distribution"""
+        # Insert the chart only if there are failures (and charts are enabled)
+        if chart is not None:
+            self._generate_failure_chart(chart)
+
+    def _render_failure_chart(self, error_types):
+        """Render a pie/donut chart of failure distribution and return it as PNG bytes"""
+        # PNG encode time scales with pixel count: keep few-slice charts small and low-DPI,
+        # 96 DPI is still sharp at the 400pt width used in the document
+        slices = len(error_types)
+        return _render_donut(
+            tuple(error_types.keys()),
+            tuple(error_types.values()),
+            ('#FF5252', '#FFA500', '#FFD700', '#FF6347', '#9370DB', '#69B4FF'),
+            figsize=(6, 4) if slices <= 3 else (8, 6),
+            title='Failure Type Distribution',
+            dpi=96 if slices <= 4 else 120,
+            compress_level=3  # ~3x faster than zlib's default level 6, slightly larger file
+        )
+
+    def _generate_failure_chart(self, chart):
+        """Insert the pie/donut chart of failure distribution"""
         try:
-            import matplotlib.pyplot as plt
-            
-            # Prepare data
-            labels = list(error_types.keys())
-            sizes = list(error_types.values())
-            colors = ['#FF5252', '#FFA500', '#FFD700', '#FF6347', '#9370DB', '#69B4FF']
-            
-            # Create figure
-            fig, ax = plt.subplots(figsize=(8, 6))
-            
-            # Use a donut chart for better readability
-            wedges, texts, autotexts = ax.pie(
-                sizes, 
-                labels=labels, 
-                colors=colors,
-                autopct='%1.1f%%',
-                startangle=90,
-                wedgeprops={'width': 0.4},  # Makes it a donut
-                textprops={'fontsize': 8}
-            )
-            
-            # Equal aspect ratio ensures the pie is circular
-            ax.axis('equal')  
-            plt.title('Failure Type Distribution', pad=20)
-            
-            # Save to temporary file
-            chart_path = "failure_analysis_chart.png"
-            plt.savefig(chart_path, bbox_inches='tight', dpi=150)
-            plt.close(fig)
+            png = chart.result()
             
             # Insert into document
-            self.doc.add_paragraph("Failure Analysis Chart:", style="Heading 3")
-            self.doc.add_picture(chart_path, width=Pt(400))  # Adjust width as needed
-            
-            # Clean up
-            os.remove(chart_path)
+            self.doc.add_paragraph("Failure Analysis Chart:", style=self._styles['Heading 3'])
+            self.doc.add_picture(io.BytesIO(png), width=Pt(400))  # Adjust width as needed
             
         except Exception as e:
             logger.error(f"Failed to generate failure chart: {str(e)}")
             self.doc.add_paragraph(
                 f"⚠ Could not generate chart: {str(e)}", 
-                style="Intense Quote"
+                style=self._styles['Intense Quote']
             )
 
     def _display_failure_table(self, error_types):
         """Display failure statistics in a table"""
-        self.doc.add_paragraph("Failure Statistics:", style="Heading 3")
+        self.doc.add_paragraph("Failure Statistics:", style=self._styles['Heading 3'])
         
         # Create a table with one row for each error type plus a header
         table = self.doc.add_table(rows=len(error_types)+1, cols=2)
-        table.style = "Light Grid Accent 1"
+        table.style = self._styles['Light Grid Accent 1']
         
         # Set header row
         header_cells = table.rows[0].cells
@@ -346,47 +601,50 @@ class DocxReportGenerator:
             # Style the count column (e.g., change text color)
             paragraph = count_cell.paragraphs[0]
             run = paragraph.add_run(count_cell.text)
-            run.font.color.rgb = RGBColor(255, 165, 0)  # Orange
+            run.font.color.rgb = _CLR_ORANGE
             paragraph.runs[0].text = ""  # Remove duplicated text in the original cell text
 
 
-    def _add_response_time_chart(self):
-        """Generate and insert histogram of API response times grouped by endpoint"""
-        try:
-            if not self.response_times:
-                return  # Skip if no response time data
+    def _render_response_time_chart(self):
+        """Render line chart of API response times grouped by endpoint and return it as PNG bytes"""
+        if self._durations.size < 2:
+            return None  # Skip if no response time data, or a single call that would plot one lone dot
 
-            # Group response times by endpoint
-            from collections import defaultdict
-            endpoint_times = defaultdict(list)
-            for entry in self.response_times:
-                endpoint_times[entry['endpoint']].append(entry['duration'])
+        # Group response times by endpoint: stable sort by endpoint code, then split into runs
+        endpoints, first_seen, codes = np.unique(self._endpoints, return_index=True, return_inverse=True)
+        groups = np.split(
+            self._durations[np.argsort(codes, kind='stable')],
+            np.cumsum(np.bincount(codes))[:-1]
+        )
+        # Keep endpoints in order of first appearance, as the legend and colors did before
+        endpoint_times = [(endpoints[g], groups[g]) for g in np.argsort(first_seen)]
 
-            # Create figure
-            plt.figure(figsize=(12, 6))
+        with _reused_figure(figsize=(12, 6)) as fig:
+            ax = fig.subplots()
             
             # Plot each endpoint's response times
             colors = ['#4CAF50', '#2196F3', '#FF5722', '#9C27B0']
-            for i, (endpoint, times) in enumerate(endpoint_times.items()):
-                plt.plot(times, marker='o', linestyle='-', 
+            for i, (endpoint, times) in enumerate(endpoint_times):
+                ax.plot(times, marker='o', linestyle='-', 
                         color=colors[i % len(colors)], 
                         label=f"{endpoint} ({len(times)} calls)")
 
-            plt.xlabel('Request Sequence')
-            plt.ylabel('Response Time (seconds)')
-            plt.title('Endpoint Response Times Over Test Execution')
-            plt.legend()
-            plt.grid(True)
+            ax.set_xlabel('Request Sequence')
+            ax.set_ylabel('Response Time (seconds)')
+            ax.set_title('Endpoint Response Times Over Test Execution')
+            ax.legend()
+            ax.grid(True)
+            return _figure_to_png(fig)
 
-            # Save and insert chart
-            chart_path = "response_time_chart.png"
-            plt.savefig(chart_path, bbox_inches='tight')
-            plt.close()
+    def _add_response_time_chart(self, chart):
+        """Insert histogram of API response times grouped by endpoint"""
+        try:
+            png = chart.result()
+            if png is None:
+                return  # Skip if no response time data
             
-            self.doc.add_paragraph("Endpoint Response Time Analysis:")
-            self.doc.paragraphs[-1].style = self.doc.styles['Heading 2']
-            self.doc.add_picture(chart_path, width=Pt(400))
-            os.remove(chart_path)
+            self.doc.add_paragraph("Endpoint Response Time Analysis:", style=self._styles['Heading 2'])
+            self.doc.add_picture(io.BytesIO(png), width=Pt(400))
         except Exception as e:
             logger.error(f"Failed to generate response time chart: {str(e)}")
             raise  # Re-raise to see error in test output
@@ -394,19 +652,21 @@ class DocxReportGenerator:
 
     def _add_test_case_list(self):
         """Add detailed table of all test cases with status"""
-        self.doc.add_heading('Detailed Test Cases', level=1)
-        table = self.doc.add_table(rows=1, cols=4)
-        table.style = 'Table Grid'
+        self.doc.add_paragraph('Detailed Test Cases', style=self._styles['Heading 1'])
+        # Pre-size the table (header + one row per test) instead of growing it row by row
+        table = self.doc.add_table(rows=1 + len(self.test_statuses), cols=4)
+        table.style = self._styles['Table Grid']
+        rows = list(table.rows)  # Materialize once; indexing table.rows rebuilds the list
         
         # Header
-        hdr = table.rows[0].cells
+        hdr = rows[0].cells
         hdr[0].text = 'Test Case ID'
         hdr[1].text = 'Test Name'
         hdr[2].text = 'Status'
         hdr[3].text = 'Duration (s)'
         # Populate data
-        for test in self.test_statuses:
-            row = table.add_row().cells
+        for table_row, test in zip(rows[1:], self.test_statuses):
+            row = table_row.cells
             row[0].text = test['id']
             row[1].text = test['name']
             
@@ -415,45 +675,62 @@ class DocxReportGenerator:
         
             # Color coding
             if test['status'] == 'Failed':
-                status.font.color.rgb = RGBColor(0xFF, 0x00, 0x00)
+                status.font.color.rgb = _CLR_RED
             else:
-                status.font.color.rgb = RGBColor(0x00, 0x80, 0x00)
+                status.font.color.rgb = _CLR_GREEN
             
             # Always show duration, formatted to 3 decimal places
             row[3].text = f"{test['duration']:.3f}"
 
-    def _add_response_time_stats(self):
-        """Add table with response time statistics"""
-        if not self.response_times:
-            return  # Exit if no response time data
+    def _collect_response_arrays(self):
+        """Build parallel endpoint/duration arrays from response times, skipping invalid entries"""
+        try:
+            durations = np.fromiter(
+                (entry['duration'] for entry in self.response_times),
+                dtype=np.float64,
+                count=len(self.response_times)
+            )
+            endpoints = np.array([entry.get('endpoint', '') for entry in self.response_times], dtype=object)
+            return endpoints, durations
+        except (KeyError, ValueError, TypeError):
+            pass
 
-        # Collect valid durations, handling possible invalid entries
+        # Slow path: collect valid durations, handling possible invalid entries
+        endpoints = []
         durations = []
         for entry in self.response_times:
             try:
                 duration = float(entry['duration'])
                 durations.append(duration)
-            except (KeyError, ValueError) as e:
+                endpoints.append(entry.get('endpoint', ''))
+            except (KeyError, ValueError, TypeError) as e:
                 logger.error(f"Ignoring invalid duration entry: {e}")
                 continue
+        return np.array(endpoints, dtype=object), np.array(durations, dtype=np.float64)
 
-        if not durations:
+    def _add_response_time_stats(self):
+        """Add table with response time statistics"""
+        if not self.response_times:
+            return  # Exit if no response time data
+
+        durations = self._durations
+        if not durations.size:
             logger.warning("No valid duration data available for statistics")
             return
 
         # Calculate statistics
         try:
-            avg_duration = sum(durations) / len(durations)
-            max_duration = max(durations)
-            min_duration = min(durations)
+            avg_duration = durations.mean()
+            max_duration = durations.max()
+            min_duration = durations.min()
         except Exception as e:
             logger.error(f"Error calculating stats: {e}")
             return
 
         # Add section to document
-        self.doc.add_heading('Response Time Statistics', level=2)
+        self.doc.add_paragraph('Response Time Statistics', style=self._styles['Heading 2'])
         table = self.doc.add_table(rows=3, cols=2)
-        table.style = 'Light Grid Accent 1'
+        table.style = self._styles['Light Grid Accent 1']
 
         # Populate table
         stats = [
@@ -470,13 +747,11 @@ class DocxReportGenerator:
             for cell in row_cells:
                 for paragraph in cell.paragraphs:
                     for run in paragraph.runs:
-                        run.font.color.rgb = RGBColor(0x00, 0x00, 0x00)  # Black
+                        run.font.color.rgb = _CLR_BLACK
 
     def _add_environment_info(self):
         """Add table showing test environment details"""
-        self.doc.add_heading('Environment Information', level=1)
-        env_table = self.doc.add_table(rows=6, cols=2)
-        env_table.style = self.doc.styles['Light List Accent 1']
+        self.doc.add_paragraph('Environment Information', style=self._styles['Heading 1'])
         
         # Environment data to display
         env_info = [
@@ -488,11 +763,11 @@ class DocxReportGenerator:
             ("CPU Cores", self.env_info['cpu_cores']),
         ]
         
-        # Populate table
-        for i, (label, value) in enumerate(env_info):
-            env_table.rows[i].cells[0].text = label
-            env_table.rows[i].cells[1].text = str(value)
-            env_table.rows[i].cells[0].paragraphs[0].runs[0].bold = True  # Bold labels
+        # Bold labels, plain values
+        self._add_xml_table(
+            [[(label, _BOLD_RPR_XML), (value, '')] for label, value in env_info],
+            self._styles['Light List Accent 1']
+        )
 
     def _add_execution_info(self):
         """Add section with test execution timing information"""
@@ -500,111 +775,103 @@ class DocxReportGenerator:
             total_duration = self.end_time - self.start_time
             minutes, seconds = divmod(total_duration, 60)
             
-            self.doc.add_heading('Execution Information', level=1)
-            exec_table = self.doc.add_table(rows=3, cols=2)
-            exec_table.style = self.doc.styles['Light List Accent 1']
-            
-            # Start time row
-            exec_table.rows[0].cells[0].text = "Test Execution Started"
-            exec_table.rows[0].cells[1].text = time.strftime('%Y-%m-%d %H:%M:%S', 
-                                                          time.localtime(self.start_time))
-            
-            # End time row
-            exec_table.rows[1].cells[0].text = "Test Execution Finished"
-            exec_table.rows[1].cells[1].text = time.strftime('%Y-%m-%d %H:%M:%S', 
-                                                           time.localtime(self.end_time))
-            
-            # Duration row
-            exec_table.rows[2].cells[0].text = "Total Test Duration"
-            exec_table.rows[2].cells[1].text = f"{int(minutes)} minutes {seconds:.2f} seconds"
+            self.doc.add_paragraph('Execution Information', style=self._styles['Heading 1'])
             
-            # Bold all labels
-            for row in exec_table.rows:
-                row.cells[0].paragraphs[0].runs[0].bold = True
+            # Start time, end time and total duration, with bold labels
+            rows = [
+                ("Test Execution Started", datetime.fromtimestamp(self.start_time).strftime(_TIMESTAMP_FMT)),
+                ("Test Execution Finished", datetime.fromtimestamp(self.end_time).strftime(_TIMESTAMP_FMT)),
+                ("Total Test Duration", f"{int(minutes)} minutes {seconds:.2f} seconds"),
+            ]
+            self._add_xml_table(
+                [[(label, _BOLD_RPR_XML), (value, '')] for label, value in rows],
+                self._styles['Light List Accent 1']
+            )
 
     def _add_error_section(self):
         """Add detailed error reports section"""
         self.doc.add_page_break()  # Start new page for errors
-        self.doc.add_heading('Test Errors Report', level=1)
-        self.doc.add_paragraph(f"The following {len(self.test_errors)} test(s) encountered errors:")
-        self.doc.paragraphs[-1].style = self.doc.styles['Intense Quote']
+        self.doc.add_paragraph('Test Errors Report', style=self._styles['Heading 1'])
+        self.doc.add_paragraph(
+            f"The following {len(self.test_errors)} test(s) encountered errors:",
+            style=self._styles['Intense Quote']
+        )
         
-        # Set monospace font for error output
-        style = self.doc.styles['Normal']
+        # Build every error paragraph as raw <w:p> elements, then insert them in one batch
+        elements = []
+        for error in self.test_errors:
+            elements.extend(self._build_error_entry(error))
+            elements.append(OxmlElement('w:p'))  # Add spacing between errors
+
+        body = self.doc.element.body
+        for element in elements:
+            body.insert_element_before(element, 'w:sectPr')  # Keep <w:sectPr> last
+
+    def _set_error_font(self):
+        """Set monospace font for error output (document-wide Normal style)"""
+        style = self._styles['Normal']
         style.font.name = 'Consolas'
         style.font.size = Pt(10)
-        
-        # Add each error with formatting
-        for error in self.test_errors:
-            self._add_single_error_entry(error)
-            self.doc.add_paragraph()  # Add spacing between errors
-
-    def _add_single_error_entry(self, error):
-        """Format and add a single error entry with syntax highlighting"""
-        error_lines = error.strip().split("\n")
-        for line in error_lines:
-            paragraph = self.doc.add_paragraph()
-            
-            # Apply different formatting based on line content
-            if line.startswith("Test Description:"):
-                run = paragraph.add_run(line)
-                run.bold = True
-                run.font.size = Pt(12)
-                run.font.color.rgb = RGBColor(0x00, 0x00, 0x8B)  # Dark blue
-                
-            elif line.startswith("Test:"):
-                run = paragraph.add_run(line)
-                run.bold = True
-                run.font.color.rgb = RGBColor(0x00, 0x00, 0xFF)  # Blue
-                
-            elif line.startswith("Error Type:"):
-                run = paragraph.add_run(line)
-                run.bold = True
-                run.font.color.rgb = RGBColor(0xFF, 0x00, 0x00)  # Red
-                
-            elif line.startswith("Error Message:"):
-                run = paragraph.add_run(line)
-                run.italic = True
-                run.font.color.rgb = RGBColor(0x8B, 0x00, 0x00)  # Dark red
-                self._add_error_message_border(paragraph)  # Add decorative border
-                
-            elif line.startswith("Request Body:"):
-                run = paragraph.add_run(line)
-                run.bold = True
-                run.font.color.rgb = RGBColor(0x80, 0x00, 0x80)  # Purple
-                
-            elif line.startswith("Response Status:") or line.startswith("Response URL:"):
-                run = paragraph.add_run(line)
-                run.font.color.rgb = RGBColor(0x00, 0x80, 0x00)  # Green
-                
-            elif line.startswith("Response Content:"):
-                run = paragraph.add_run(line)
-                run.underline = True
-                run.font.color.rgb = RGBColor(0x00, 0x80, 0x80)  # Teal
+
+    def _build_error_entry(self, error):
+        """
+        Format a single error entry with syntax highlighting as a list of <w:p> elements.
+
+        Contiguous lines sharing the same styling are joined into one run, and runs
+        follow each other in a single paragraph separated by line breaks. A new
+        paragraph only starts after a separator or around a bordered line, since
+        the border applies to the whole paragraph.
+        """
+        groups = []  # [rpr, bordered, lines] per paragraph; None marks a separator
+        for line in error.strip().split("\n"):
+            # Apply different formatting based on the line's "<prefix>:" label
+            key, sep, _ = line.partition(':')
+            style = _LINE_STYLES.get(key) if sep else None
+            if style is not None:
+                rpr, bordered = _LINE_RPR[key], style[5]
                 
-            elif line.startswith("----------------------------------------"):
-                self.doc.add_paragraph()  # Add extra spacing for separators
+            elif line.startswith(_ERROR_SEPARATOR):
+                groups.append(None)
+                continue
                 
+            elif line.strip().startswith(("{", "[")):
+                rpr, bordered = _JSON_RPR, False  # Color JSON content differently
             else:
-                # Color JSON content differently
-                if line.strip().startswith(("{", "[")):
-                    run = paragraph.add_run(line)
-                    run.font.color.rgb = RGBColor(0xA5, 0x2A, 0x2A)  # Brown
-                else:
-                    paragraph.add_run(line)  # Default formatting
-
-    def _add_error_message_border(self, paragraph):
-        """Add decorative border around error messages"""
-        p_pr = paragraph._p.get_or_add_pPr()
-        borders = OxmlElement('w:pBorders')
-        
-        # Add borders to all sides
-        for border_side in ['top', 'left', 'bottom', 'right']:
-            border = OxmlElement(f'w:{border_side}')
-            border.set(qn('w:val'), 'single')  # Single line
-            border.set(qn('w:sz'), '12')       # Size
-            border.set(qn('w:space'), '0')     # No spacing
-            border.set(qn('w:color'), '8B0000')  # Dark red color
-            borders.append(border)
-        
-        p_pr.append(borders)
\ No newline at end of file
+                rpr, bordered = None, False  # Default formatting
+
+            last = groups[-1] if groups else None
+            if last is not None and last[0] is rpr and not (bordered or last[1]):
+                last[2].append(line)
+            else:
+                groups.append([rpr, bordered, [line]])
+
+        paragraphs = []
+        p = None  # Paragraph currently receiving runs
+        for group in groups:
+            if group is None:
+                # Separator line plus extra spacing
+                paragraphs.extend((OxmlElement('w:p'), OxmlElement('w:p')))
+                p = None
+                continue
+
+            rpr, bordered, lines = group
+            text = "\n".join(lines)
+            if bordered or p is None:
+                p = OxmlElement('w:p')
+                paragraphs.append(p)
+                if bordered:
+                    self._add_error_message_border(p)  # Add decorative border
+            else:
+                text = "\n" + text  # Break from the previous run's last line
+            r = p.add_r()
+            if rpr is not None:
+                r.append(deepcopy(rpr))
+            if text:
+                r.text = text  # Each "\n" becomes a <w:br/> inside the run
+            if bordered:
+                p = None  # Keep the border to this line only
+        return paragraphs
+
+    def _add_error_message_border(self, p):
+        """Add decorative border around error messages (p is the raw <w:p> element)"""
+        p.get_or_add_pPr().append(deepcopy(_BORDER_TMPL))
@@ -2,19 +2,31 @@ import os
 import json
 import time
 import logging
-import statistics  # For calculating statistical metrics
+import numpy as np  # For percentile selection over response durations
 from jinja2 import Environment, FileSystemLoader # For templating HTML reports
-from collections import defaultdict
+from markupsafe import escape  # Pre-escape display strings once so autoescape can skip them
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 import re 
+from .RunningStats import RunningStats
 
 # Set up logger for reporting errors or debug information
 logger = logging.getLogger(__name__)
 
+# Matches a standalone 3-digit HTTP status code inside an error message
+_STATUS_CODE_RE = re.compile(r'\b\d{3}\b')
+
+# Matches "password": "<value>" pairs inside JSON request bodies
+_PASSWORD_RE = re.compile(r'("password"\s*:\s*)(["\'])(.*?)(["\'])', flags=re.IGNORECASE)
+
 class HTMLReportGenerator:
     """
     Generates an HTML test report with charts and test summaries using Jinja2 templates.
     """
 
+    WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB output buffer for the rendered report
+
     def __init__(self, report_data):
         """
         Initialize the report generator with input test data and load the template environment.
@@ -34,6 +46,8 @@ class HTMLReportGenerator:
         self.template_env = Environment(loader=FileSystemLoader(template_path), autoescape=True)
         self.template_env.filters['extract_test_name'] = self._extract_test_name
         self.template_env.filters['extract_error_type'] = self._extract_error_type
+        self.template_env.filters['format_timestamp'] = self._format_timestamp
+        self.template_env.filters['humanize_duration'] = self._humanize_duration
         
         # Define output report file name
         self.output_file = 'test_report.html'
@@ -66,6 +80,34 @@ class HTMLReportGenerator:
         match = re.search(r'Type:\s*(.*)', error_text)
         return match.group(1) if match else "Unknown Error"
 
+    @staticmethod
+    def _format_timestamp(timestamp):
+        """
+        Format an epoch timestamp as local date and time.
+
+        Args:
+            timestamp (float): Seconds since the epoch.
+
+        Returns:
+            str: Timestamp formatted as "YYYY-MM-DD HH:MM:SS".
+        """
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+    @staticmethod
+    def _humanize_duration(duration):
+        """
+        Format a duration in seconds as hours, minutes and seconds.
+
+        Args:
+            duration (float): Duration in seconds.
+
+        Returns:
+            str: Duration formatted as "<h>h <m>m <s>s".
+        """
+        hours, remainder = divmod(duration, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{int(hours)}h {int(minutes)}m {int(seconds)}s"
+
     def _redact_passwords(self, error_text):
         """
         Replace password values in JSON request bodies with "REDACTED".
@@ -76,37 +118,51 @@ class HTMLReportGenerator:
         Returns:
             str: Error message with passwords redacted.
         """
-        password_pattern = re.compile(r'("password"\s*:\s*)(["\'])(.*?)(["\'])', flags=re.IGNORECASE)
-        return password_pattern.sub(r'\1\2REDACTED\4', str(error_text))
+        return _PASSWORD_RE.sub(r'\1\2REDACTED\4', str(error_text))
 
     def generate(self):
         """
         Render the report template with collected data and write the final HTML report.
         """
         try:
-            # Redact passwords in error messages
-            processed_errors = [self._redact_passwords(error) for error in self.report_data['test_errors']]
-            
-            # Prepare contextual data for the HTML template
-            context = {
-                'meta': self._prepare_metadata(),
-                'summary': self._prepare_summary_data(),
-                'charts': self._prepare_chart_data(),
-                'errors': processed_errors,
-                'environment': self._prepare_environment_data(),
-                'execution': self._prepare_execution_data(),
-                'test_cases': self.report_data['test_statuses'],
-                'response_stats': self._prepare_response_stats(),
-                'false_positives': self.report_data.get('false_positives', [])
-            }
-
-            # Load and render the HTML base template
+            # Chart data, response stats and password redaction only read report_data,
+            # so run them concurrently (regex and numpy work release the GIL)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                charts_future = executor.submit(self._prepare_chart_data)
+                stats_future = executor.submit(self._prepare_response_stats)
+                errors_future = executor.submit(
+                    lambda: [self._redact_passwords(error) for error in self.report_data['test_errors']]
+                )
+
+                # Prepare contextual data for the HTML template
+                context = {
+                    'meta': self._prepare_metadata(),
+                    'summary': self._prepare_summary_data(),
+                    'environment': self._prepare_environment_data(),
+                    'execution': self._prepare_execution_data(),
+                    'test_cases': self._prepare_test_cases(),
+                    'false_positives': self.report_data.get('false_positives', []),
+                    'charts': charts_future.result(),
+                    'errors': errors_future.result(),
+                    'response_stats': stats_future.result()
+                }
+
+            # Load the HTML base template
             template = self.template_env.get_template('base.html')
-            html_content = template.render(context)
 
-            # Save rendered HTML content to the output file
-            with open(self.output_file, 'w') as f:
-                f.write(html_content)
+            # Stream rendered chunks to a temp file next to the output through a large buffer,
+            # then swap it in, so a rendering error never leaves a truncated report behind
+            tmp_path = f"{self.output_file}.tmp"
+            try:
+                with open(tmp_path, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
+                    for chunk in template.generate(context):
+                        f.write(chunk.encode('utf-8'))
+                os.replace(tmp_path, self.output_file)
+            except Exception:
+                # open() itself may have failed, in which case there is nothing to remove
+                with suppress(FileNotFoundError):
+                    os.unlink(tmp_path)
+                raise
 
         except Exception as e:
             # Log and re-raise any exceptions encountered during generation
@@ -121,10 +177,10 @@ class HTMLReportGenerator:
             dict: Metadata including project name, environment, and generation time.
         """
         return {
-            'project': os.getenv('PROJECT_NAME', 'N/A'),
-            'environment': os.getenv('ENVIRONMENT', 'Staging'),
-            'generated': time.strftime('%B %d, %Y %H:%M:%S'),
-            'base_url': self.report_data['base_url']
+            'project': escape(os.getenv('PROJECT_NAME', 'N/A')),
+            'environment': escape(os.getenv('ENVIRONMENT', 'Staging')),
+            'generated': escape(time.strftime('%B %d, %Y %H:%M:%S')),
+            'base_url': escape(self.report_data['base_url'])
         }
 
     def _prepare_summary_data(self):
@@ -153,35 +209,39 @@ class HTMLReportGenerator:
         Returns:
             dict: Chart data including error types and response times based on test durations.
         """
-        error_types = defaultdict(int)
         # Categorize errors by type or status code
-        for error in self.report_data['test_errors']:
-            match = re.search(r'\b\d{3}\b', str(error))
-            if match:
-                status_code = match.group()
-                error_types[f"{status_code} Error"] += 1
-            elif "Timeout" in str(error):
-                error_types["Timeout"] += 1
-            else:
-                error_types["Other Errors"] += 1
+        error_types = Counter(self._classify_error(str(error)) for error in self.report_data['test_errors'])
 
         # Build the “response_times” array from test_statuses durations
         response_times = []
-        for idx, test in enumerate(self.report_data.get('test_statuses', [])):
-            raw_duration_s = test.get('duration', 0)
+        # Bind loop-invariant lookups to locals once instead of on every iteration
+        statuses = self.report_data.get('test_statuses', [])
+        start_time = self.report_data['start_time']
+        strftime = time.strftime
+        localtime = time.localtime
+        append = response_times.append
+        for idx, test in enumerate(statuses):
+            try:
+                raw_duration_s = test['duration']
+            except KeyError:
+                raw_duration_s = 0
+            try:
+                name = test['name']
+            except KeyError:
+                name = test.get('id', 'Unknown Test')
             # Convert to milliseconds for the chart
             duration_ms = float(raw_duration_s) * 1000
 
             #spread them evenly from the report start time:
-            ts = self.report_data['start_time'] + idx
+            ts = start_time + idx
             timestamp_ms = float(ts) * 1000 if ts < 1e12 else float(ts)
-            formatted = time.strftime('%m/%d/%Y %H:%M', time.localtime(timestamp_ms / 1000))
+            formatted = strftime('%m/%d/%Y %H:%M', localtime(timestamp_ms / 1000))
 
-            response_times.append({
+            append({
                 'timestamp': timestamp_ms,
                 'formatted_time': formatted,
                 'duration': duration_ms,
-                'test_name': test.get('name', test.get('id', 'Unknown Test'))
+                'test_name': name
             })
 
         response_times.sort(key=lambda x: x['timestamp'])
@@ -194,51 +254,107 @@ class HTMLReportGenerator:
             'response_times': response_times,
         }
 
-    def _prepare_execution_data(self):
+    @staticmethod
+    def _classify_error(error_text):
         """
-        Format start and end timestamps and compute total execution time.
+        Map an error message to the label used in the error distribution chart.
+
+        Args:
+            error_text (str): The error message text.
 
         Returns:
-            dict: Execution metadata including start time, end time, and duration.
+            str: "<code> Error", "Timeout" or "Other Errors".
         """
-        duration = self.report_data['end_time'] - self.report_data['start_time']
-        hours, remainder = divmod(duration, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        human_duration = f"{int(hours)}h {int(minutes)}m {int(seconds)}s"
+        match = _STATUS_CODE_RE.search(error_text)
+        if match:
+            return f"{match.group()} Error"
+        if "Timeout" in error_text:
+            return "Timeout"
+        return "Other Errors"
+
+    def _prepare_execution_data(self):
+        """
+        Collect raw start and end timestamps and the total execution time.
+
+        Formatting is left to the template's format_timestamp and humanize_duration filters.
 
+        Returns:
+            dict: Execution metadata including start timestamp, end timestamp, and duration.
+        """
         return {
-            'start': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.report_data['start_time'])),
-            'end': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.report_data['end_time'])),
-            'duration': duration,
-            'human_duration': human_duration
+            'start_ts': self.report_data['start_time'],
+            'end_ts': self.report_data['end_time'],
+            'duration': self.report_data['end_time'] - self.report_data['start_time']
         }
 
     def _prepare_response_stats(self):
         """
         Calculate statistical metrics for response durations.
 
+        Mean, min, max and count come from the running aggregates collected while
+        the tests executed; only the median and percentiles touch the samples.
+
         Returns:
             dict: Response time statistics including averages, percentiles, and counts.
         """
-        durations = [float(rt['duration']) for rt in self.report_data.get('response_times', []) if rt.get('duration') is not None]
-        if not durations:
+        durations = np.fromiter(
+            (rt['duration'] for rt in self.report_data.get('response_times', []) if rt.get('duration') is not None),
+            dtype=np.float64
+        )
+        if not durations.size:
             return None
 
+        running = self.report_data.get('response_stats')
+        if running is None or running.count != durations.size:
+            running = RunningStats.from_values(durations)
+
+        n = durations.size
+        # Order statistics needed for the median and the exclusive-method percentiles
+        median_idx = [(n - 1) // 2, n // 2]
+        pct_idx = {p: self._percentile_indices(n, p) for p in (90, 95, 99)} if n >= 10 else {}
+        kth = sorted(set(median_idx).union(*(pair[:2] for pair in pct_idx.values())))
+        ordered = np.partition(durations, kth)
+
+        def percentile(p):
+            if p not in pct_idx:
+                return None
+            lo, hi, delta = pct_idx[p]
+            return float((ordered[lo] * (100 - delta) + ordered[hi] * delta) / 100)
+
         stats = {
-            'average': statistics.mean(durations),
-            'median': statistics.median(durations),
-            'min': min(durations),
-            'max': max(durations),
-            'count': len(durations),
+            'average': running.mean,
+            'median': float((ordered[median_idx[0]] + ordered[median_idx[1]]) / 2),
+            'min': running.min,
+            'max': running.max,
+            'count': running.count,
             'percentiles': {
-                'p90': statistics.quantiles(durations, n=100)[89] if len(durations) >= 10 else None,
-                'p95': statistics.quantiles(durations, n=100)[94] if len(durations) >= 10 else None,
-                'p99': statistics.quantiles(durations, n=100)[98] if len(durations) >= 10 else None
+                'p90': percentile(90),
+                'p95': percentile(95),
+                'p99': percentile(99)
             }
         }
 
         return stats
 
+    @staticmethod
+    def _percentile_indices(n, p):
+        """
+        Locate the two order statistics bracketing the p-th percentile.
+
+        Mirrors the default ('exclusive') method of statistics.quantiles(n=100).
+
+        Args:
+            n (int): Number of samples.
+            p (int): Percentile in the range 1..99.
+
+        Returns:
+            tuple: (lower index, upper index, interpolation weight out of 100).
+        """
+        m = n + 1
+        j = min(max(p * m // 100, 1), n - 1)
+        delta = p * m - j * 100
+        return j - 1, j, delta
+
     def _prepare_environment_data(self):
         """
         Gather system environment information for display in the report.
@@ -246,15 +362,28 @@ class HTMLReportGenerator:
         Returns:
             dict: Environment metadata including Python version, platform, and hostname.
         """
+        env_info = self.report_data['env_info']
         return {
-            'python_version': self.report_data['env_info']['python_version'],
-            'platform': self.report_data['env_info']['platform'],
-            'requests_version': self.report_data['env_info']['requests_version'],
-            'hostname': self.report_data['env_info']['hostname'],
-            'cpu_cores': self.report_data['env_info']['cpu_cores'],
-            'base_url': self.report_data['base_url']
+            'python_version': escape(env_info['python_version']),
+            'platform': escape(env_info['platform']),
+            'requests_version': escape(env_info['requests_version']),
+            'hostname': escape(env_info['hostname']),
+            'cpu_cores': escape(env_info['cpu_cores']),
+            'base_url': escape(self.report_data['base_url'])
         }
 
+    def _prepare_test_cases(self):
+        """
+        Escape the displayed test case fields once, ahead of rendering.
+
+        Returns:
+            list: Test case dicts whose string fields are already HTML-safe.
+        """
+        return [
+            {**test, 'id': escape(test['id']), 'name': escape(test['name']), 'status': escape(test['status'])}
+            for test in self.report_data['test_statuses']
+        ]
+
 
 
 
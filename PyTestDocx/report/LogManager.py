@@ -1,5 +1,6 @@
 import os
 import logging
+from .RunningStats import RunningStats
 
 class LogManager:
     """Handles test logging, error tracking, and file management."""
@@ -11,6 +12,7 @@ class LogManager:
     def __init__(self):
         self.test_errors = []
         self.response_times = []
+        self.response_stats = RunningStats()  # Running aggregates over response_times
         self._configure_logging()
 
     def _configure_logging(self):
@@ -35,6 +37,12 @@ class LogManager:
         with open(self.EXECUTED_LOG_FILE, 'a') as f:
             f.write(f"{status}: {test_id}\n")
 
+    def record_response_time(self, entry):
+        """Store a response-time entry and fold its duration into the running stats."""
+        self.response_times.append(entry)
+        if entry.get('duration') is not None:
+            self.response_stats.update(entry['duration'])
+
     def log_test_error(self, log_entry):
         """Record errors and write to error log."""
         logger = logging.getLogger(__name__)
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+import math
+
+
+@dataclass
+class RunningStats:
+    """
+    Online accumulator for response durations (Welford's algorithm).
+
+    Updated every time a response time is recorded so that mean, min, max and
+    count are available in O(1) at report time without sweeping the samples.
+    """
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    count: int = 0
+
+    def update(self, value):
+        """
+        Fold a single sample into the running aggregates.
+
+        Args:
+            value (float): The new duration sample.
+        """
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def variance(self):
+        """Sample variance of the values seen so far (0.0 with fewer than two samples)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Build an accumulator from an existing iterable of samples.
+
+        Args:
+            values (iterable): Duration samples.
+
+        Returns:
+            RunningStats: Aggregates over all given values.
+        """
+        stats = cls()
+        for value in values:
+            stats.update(value)
+        return stats
@@ -2,10 +2,12 @@
 from .DocxReportGenerator import DocxReportGenerator
 from .LogManager import LogManager
 from .HTMLReportGenerator import HTMLReportGenerator
+from .RunningStats import RunningStats
 
 __all__ = [
 
     'DocxReportGenerator',
     'LogManager',
     'HTMLReportGenerator',
+    'RunningStats',
 ]
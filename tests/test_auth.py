@@ -1,24 +1,26 @@
 from PyTestDocx import BaseAPITest
 import unittest
-import time
 
 class TestAuthentication(BaseAPITest):
     """Tests for login/logout functionality"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the endpoint URLs once per class from the configured base URL"""
+        super().setUpClass()
+        cls.logout_url = f"{cls.base_url}/logout"
+        cls.transaction_url = f"{cls.base_url}/get-transaction-data/1"
     
     def test_successful_login(self):
         """Valid credentials should return access token"""
         response = self.login()
         self.assert_response(response, 200)
-        self.assertIsNotNone(self.access_token)
-        self.assertIsNotNone(self.user_id)
-
-    def test_invalid_login(self):
-        """Invalid credentials should be rejected"""
-        response = self.login('invalid_user', 'wrong_password')
-        self.assertNotEqual(response.status_code, 200)
+        # login() stores these via .get(), so a 200 alone does not guarantee them
+        self.assertNotIn(None, (self.access_token, self.user_id),
+                         "Login response should include an access token and user id")
 
-    def test_invalid_login_with_specific_code(self):
-        """Invalid credentials should return specific error code"""
+    def test_invalid_login_returns_460(self):
+        """Invalid credentials should be rejected with specific error code"""
         response = self.login('invalid_user', 'wrong_password')
         self.assertEqual(response.status_code, 460)
 
@@ -31,7 +33,7 @@ class TestAuthentication(BaseAPITest):
         # Logout - using make_request instead of direct session call
         logout_response = self.make_request(
             'GET',
-            f"{self.base_url}/logout",
+            self.logout_url,
             expected_status=200,
             headers=self.auth_headers()
         )
@@ -40,7 +42,7 @@ class TestAuthentication(BaseAPITest):
         # Verify session is invalidated
         check_response = self.make_request(
             'GET',
-            f"{self.base_url}/get-transaction-data/1",
+            self.transaction_url,
             headers=self.auth_headers()
         )
         self.assertNotEqual(check_response.status_code, 200)
\ No newline at end of file